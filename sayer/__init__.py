@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING
 
 from monkay import Monkay
 
-from .__version__ import get_version
+from .__version__ import __version__  # noqa
 
 if TYPE_CHECKING:
     from sayer.core.groups.sayer import SayerGroup
@@ -17,8 +17,6 @@ if TYPE_CHECKING:
     from .utils.ui import echo, error, info, success, warning
     from .utils.ui_helpers import confirm, progress, table
 
-__version__ = get_version()
-
 monkay: Monkay = Monkay(
     globals(),
     lazy_imports={
@@ -48,7 +46,7 @@ monkay: Monkay = Monkay(
     package="sayer",
 )
 
-__all__ = [
+__all__ = (
     "command",
     "group",
     "Sayer",
@@ -70,4 +68,4 @@ __all__ = [
     "echo",
     "SayerGroup",
     "SayerCommand",
-]
+)
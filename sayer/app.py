@@ -1,13 +1,11 @@
 import inspect
 import json
+import weakref
 from typing import (
     Annotated,
     Any,
     Callable,
     TypeVar,
-    get_args,
-    get_origin,
-    get_type_hints,
     overload,
 )
 
@@ -17,16 +15,87 @@ from sayer.conf import monkay
 from sayer.core.commands.base import BaseSayerCommand
 from sayer.core.commands.config import CustomCommandConfig
 from sayer.core.commands.sayer import SayerCommand, wrap_click_command
-from sayer.core.engine import build_click_parameter
+from sayer.core.engine import _is_parameter_metadata, build_click_parameter
 from sayer.core.groups.sayer import SayerGroup
+from sayer.core.utils import _cached_signature, _cached_type_hints, _origin_and_args
 from sayer.params import Argument, Env, JsonParam, Option, Param
-from sayer.state import State
+from sayer.state import is_state_class
 from sayer.utils.coercion import coerce_argument_to_option
 from sayer.utils.ui import warning
 
 _EMPTY_PARAMETER_SENTINEL = inspect._empty
+# Commands that `Sayer.add_command` mounts without wrapping them in a `SayerCommand`.
+_MOUNTED_AS_IS_TYPES = (click.Group, BaseSayerCommand)
 T = TypeVar("T", bound=Callable[..., Any])
 
+# Functions already stamped by `Sayer._apply_param_logic`. Stamping appends to
+# `__click_params__`, so doing it twice would register every parameter twice.
+_STAMPED_FUNCTIONS: "weakref.WeakSet[Callable[..., Any]]" = weakref.WeakSet()
+_CO_VARARGS = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+
+
+def _takes_no_parameters(target_function: Callable[..., Any]) -> bool:
+    """
+    Checks, from the code object alone, whether a plain function declares no
+    parameters at all, in which case there is nothing to stamp.
+
+    Functions carrying `__wrapped__` or `__signature__` are reported as having
+    parameters, since `inspect.signature` may resolve them to something else.
+    """
+    code = getattr(target_function, "__code__", None)
+    if code is None or hasattr(target_function, "__wrapped__") or hasattr(target_function, "__signature__"):
+        return False
+    return not (code.co_argcount or code.co_kwonlyargcount or code.co_flags & _CO_VARARGS)
+
+
+def _build_callback_binder(callback_handler: Callable[..., Any]) -> Callable[[click.Context], dict[str, Any]]:
+    """
+    Resolves, once, how each parameter of a root callback is filled at invocation
+    and returns a function that builds the callback's keyword arguments.
+
+    Args:
+        callback_handler: The stamped callback registered through `Sayer.callback`.
+
+    Returns:
+        A function taking the current `click.Context` and returning the keyword
+        arguments: the context for `click.Context` parameters, and the parsed value
+        from `ctx.params` otherwise, JSON-decoded for `JsonParam` parameters.
+    """
+    function_signature = _cached_signature(callback_handler)
+    type_hints = _cached_type_hints(callback_handler)
+    context_names: list[str] = []
+    value_names: list[str] = []
+    json_names: list[str] = []
+    for param_name, param_info in function_signature.parameters.items():
+        annotation = type_hints.get(param_name, param_info.annotation)
+        if annotation is click.Context:
+            context_names.append(param_name)
+            continue
+        value_names.append(param_name)
+        annotation_origin, annotation_args = _origin_and_args(annotation)
+        is_json_param_annotated = annotation_origin is Annotated and any(
+            isinstance(meta, JsonParam) for meta in annotation_args[1:]
+        )
+        if is_json_param_annotated or isinstance(param_info.default, JsonParam):
+            json_names.append(param_name)
+
+    context_names_tuple = tuple(context_names)
+    value_names_tuple = tuple(value_names)
+    json_names_tuple = tuple(json_names)
+
+    def bind_arguments(ctx: click.Context) -> dict[str, Any]:
+        parameter_values = ctx.params
+        bound_arguments = {name: parameter_values.get(name) for name in value_names_tuple}
+        # JSON parameters get parsed here
+        for name in json_names_tuple:
+            if isinstance(bound_arguments[name], str):
+                bound_arguments[name] = json.loads(bound_arguments[name])
+        for name in context_names_tuple:
+            bound_arguments[name] = ctx
+        return bound_arguments
+
+    return bind_arguments
+
 
 class Sayer:
     """
@@ -35,6 +104,20 @@ class Sayer:
     root-level callbacks executed before any command or subcommand.
     """
 
+    __slots__ = (
+        "_initial_obj",
+        "_context_class",
+        "_callbacks",
+        "_required_callback_options",
+        "_custom_commands",
+        "_custom_command_config",
+        "_registered_commands",
+        "invoke_without_command",
+        "_group",
+        "_command_class",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         name: str | None = None,
@@ -83,23 +166,29 @@ class Sayer:
         """
         self._initial_obj = context
         self._context_class = context_class
-        self._callbacks: list[Callable[..., Any]] = []
+        # Each root callback is kept with its argument binder, see `_build_callback_binder`.
+        self._callbacks: list[tuple[Callable[..., Any], Callable[[click.Context], dict[str, Any]]]] = []
+        # Required options across all root callbacks, checked before any callback runs.
+        self._required_callback_options: list[click.Option] = []
         self._custom_commands: dict[str, click.Command] = {}
         self._custom_command_config: CustomCommandConfig = CustomCommandConfig(title="Custom")
         self._registered_commands: set[str] = set()
 
-        # Build up the keyword arguments for the Click group
-        group_initialization_attributes: dict[str, Any] = {}
+        # Click only reads `context_settings`, so the caller's dict is reused unless
+        # the initial context object has to be merged into it.
+        if context is not None:
+            resolved_context_settings = {**(context_settings or {}), "obj": context}
+        else:
+            resolved_context_settings = context_settings or {}
+
+        # Build up the keyword arguments for the Click group. `group_attrs` cannot
+        # repeat any of the named keywords, so it is merged in the same literal.
+        group_initialization_attributes: dict[str, Any] = {"context_settings": resolved_context_settings, **group_attrs}
         if help is not None:
             group_initialization_attributes["help"] = help
         if epilog is not None:
             group_initialization_attributes["epilog"] = epilog
 
-        resolved_context_settings = context_settings.copy() if context_settings else {}
-        if context is not None:
-            resolved_context_settings["obj"] = context
-        group_initialization_attributes["context_settings"] = resolved_context_settings
-
         # Apply init-time flags; these can be overridden per-callback later
         self.invoke_without_command = invoke_without_command
         if invoke_without_command:
@@ -108,8 +197,6 @@ class Sayer:
         if no_args_is_help:
             group_initialization_attributes["no_args_is_help"] = no_args_is_help
 
-        group_initialization_attributes.update(group_attrs)
-
         # Instantiate the Click group
         cli_group = group_class(name=name, **group_initialization_attributes)
         cli_group.context_class = context_class
@@ -126,8 +213,25 @@ class Sayer:
                 raise ValueError("`version` must be provided with `add_version_option=True`")
             cli_group = click.version_option(version, "--version", "-v")(cli_group)
 
+        # The callback-aware invoke wrapper is only installed once a root callback
+        # is registered, see `_install_callback_invoke`.
+        self._group: SayerGroup = cli_group
+        self._command_class = command_class
+
+    def _install_callback_invoke(self) -> None:
+        """
+        Replaces the group's `invoke` with one that runs the registered root
+        callbacks before the standard Click dispatch.
+
+        Called when the first callback is registered, so applications without
+        callbacks dispatch through Click's own `invoke` with no extra frame.
+        """
+        cli_group = self._group
         # Preserve the original invoke method to be called after callbacks
         original_group_invoke = cli_group.invoke
+        # Shared with `callback`, so callbacks registered later are picked up without reinstalling
+        callbacks = self._callbacks
+        required_options = self._required_callback_options
 
         def invoke_with_sayer_callbacks(ctx: click.Context) -> Any:
             """
@@ -137,54 +241,31 @@ class Sayer:
             if ctx.resilient_parsing:
                 return original_group_invoke(ctx)
 
-            # by default (invoke_without_command=False), skip root callbacks if a subcommand is being called
-            # Click 8 keeps the next command token in _protected_args.
-            # Accessing the public protected_args property emits a deprecation warning.
-            tokens = list(getattr(ctx, "_protected_args", ()) or ctx.args)
-
-            if tokens and tokens[0] in cli_group.commands and not cli_group.invoke_without_command:
-                return original_group_invoke(ctx)
+            # by default (invoke_without_command=False), skip root callbacks if a subcommand is being called.
+            # The flag is checked first so the token lookup only happens when it can matter.
+            if not cli_group.invoke_without_command:
+                # Click 8 keeps the next command token in _protected_args.
+                # Accessing the public protected_args property emits a deprecation warning.
+                tokens = getattr(ctx, "_protected_args", None) or ctx.args
+                if tokens and tokens[0] in cli_group.commands:
+                    return original_group_invoke(ctx)
 
             # Enforce any required callback options upfront
             # This reproduces Click's behavior for missing required options
-            for callback_handler in self._callbacks:
-                for parameter_object in getattr(callback_handler, "__click_params__", []):
-                    # The print statements are retained to match original behavior,
-                    # though they are unusual for production code.
-                    if isinstance(parameter_object, click.Option) and parameter_object.required:
-                        if ctx.params.get(parameter_object.name) is None:
-                            # Raise the same MissingParameter Click would
-                            raise click.MissingParameter(parameter_object, ctx)  # type: ignore
+            for required_option in required_options:
+                if ctx.params.get(required_option.name) is None:
+                    # Raise the same MissingParameter Click would
+                    raise click.MissingParameter(required_option, ctx)  # type: ignore
 
             # Run each callback in registration order
-            for callback_handler in self._callbacks:
-                function_signature = inspect.signature(callback_handler)
-                type_hints = get_type_hints(callback_handler, include_extras=True)
-                bound_arguments: dict[str, Any] = {}
-                for param_name, param_info in function_signature.parameters.items():
-                    annotation = type_hints.get(param_name, param_info.annotation)
-                    if annotation is click.Context:
-                        bound_arguments[param_name] = ctx
-                    else:
-                        parameter_value = ctx.params.get(param_name)
-                        # JSON parameters get parsed here
-                        is_json_param_annotated = get_origin(annotation) is Annotated and any(
-                            isinstance(meta, JsonParam) for meta in get_args(annotation)[1:]
-                        )
-                        is_json_param_default = isinstance(param_info.default, JsonParam)
-
-                        if (is_json_param_annotated or is_json_param_default) and isinstance(parameter_value, str):
-                            parameter_value = json.loads(parameter_value)
-                        bound_arguments[param_name] = parameter_value
-                callback_handler(**bound_arguments)
+            for callback_handler, bind_arguments in callbacks:
+                callback_handler(**bind_arguments(ctx))
 
             # Proceed with normal Click dispatch
             return original_group_invoke(ctx)
 
         # Install our wrapper
         cli_group.invoke = invoke_with_sayer_callbacks  # type: ignore
-        self._group: SayerGroup = cli_group
-        self._command_class = command_class
 
     def _apply_param_logic(self, target_function: Callable[..., Any]) -> Callable[..., Any]:
         """
@@ -198,40 +279,51 @@ class Sayer:
         Returns:
             The function decorated with Click parameters.
         """
-        function_signature = inspect.signature(target_function)
-        type_hints = get_type_hints(target_function, include_extras=True)
+        try:
+            if target_function in _STAMPED_FUNCTIONS:
+                return target_function
+        except TypeError:
+            # Not weak-referenceable (e.g. some builtins); stamp without caching.
+            pass
+
+        if _takes_no_parameters(target_function):
+            return target_function
+
+        function_signature = _cached_signature(target_function)
+        type_hints = _cached_type_hints(target_function)
         wrapped_function = target_function
+        # Resolve every annotation once; both the context scan and the main loop use it
+        resolved_parameters = [
+            (param_obj, type_hints.get(param_obj.name, param_obj.annotation))
+            for param_obj in function_signature.parameters.values()
+        ]
         # Check if click.Context is injected, to pass to build_click_parameter
-        context_param_injected = any(
-            type_hints.get(p.name, p.annotation) is click.Context for p in function_signature.parameters.values()
-        )
+        context_param_injected = any(annotation is click.Context for _, annotation in resolved_parameters)
 
         # Decorate in reverse order so the parameters nest correctly as per Click's design
-        for param_obj in reversed(function_signature.parameters.values()):
-            annotation = type_hints.get(param_obj.name, param_obj.annotation)
+        for param_obj, annotation in reversed(resolved_parameters):
             # Skip Context or State injections as they are handled by Click/Sayer directly
-            if annotation is click.Context or (isinstance(annotation, type) and issubclass(annotation, State)):
+            if annotation is click.Context or is_state_class(annotation):
                 continue
 
             raw_type_annotation = annotation if annotation is not _EMPTY_PARAMETER_SENTINEL else str
+            raw_origin, raw_args = _origin_and_args(raw_type_annotation)
+            is_annotated = raw_origin is Annotated
+            annotated_args = raw_args if is_annotated else ()
             # Extract the actual parameter type, unwrapping from Annotated if present
-            actual_param_type = (
-                get_args(raw_type_annotation)[0]
-                if get_origin(raw_type_annotation) is Annotated
-                else raw_type_annotation
-            )
+            actual_param_type = annotated_args[0] if is_annotated else raw_type_annotation
 
             parameter_metadata: Param | Option | Argument | Env | JsonParam | None = None
             parameter_help_text = ""
-            if get_origin(raw_type_annotation) is Annotated:
-                for metadata_item in get_args(raw_type_annotation)[1:]:
-                    if isinstance(metadata_item, (Option, Env, Param, Argument, JsonParam)):
+            if is_annotated:
+                for metadata_item in annotated_args[1:]:
+                    if _is_parameter_metadata(metadata_item):
                         parameter_metadata = metadata_item
                     elif isinstance(metadata_item, str):
                         parameter_help_text = metadata_item
 
             # Fallback to default-based metadata if not explicitly provided via Annotated
-            if parameter_metadata is None and isinstance(param_obj.default, (Option, Argument, Env, Param, JsonParam)):
+            if parameter_metadata is None and _is_parameter_metadata(param_obj.default):
                 parameter_metadata = param_obj.default
 
             is_overriden_type = False
@@ -251,6 +343,10 @@ class Sayer:
                 is_overriden_type,
             )
 
+        try:
+            _STAMPED_FUNCTIONS.add(wrapped_function)
+        except TypeError:
+            pass
         return wrapped_function
 
     @overload
@@ -293,51 +389,39 @@ class Sayer:
                 self._group.no_args_is_help = no_args_override
 
             # Iterate through the Click parameters generated for the stamped function
+            group_parameters: list[click.Parameter] = []
             for param_config in getattr(stamped_function, "__click_params__", []):
                 if isinstance(param_config, click.Option):
-                    # If a required option has an implicit default (Ellipsis or _empty),
-                    # normalize it to None to ensure Click's MissingParameter logic triggers reliably.
-                    if param_config.required and (
-                        param_config.default is ... or param_config.default is _EMPTY_PARAMETER_SENTINEL
-                    ):
+                    # An implicit default (Ellipsis or _empty) becomes None, whether the option
+                    # is required or not: Click's MissingParameter logic then triggers reliably
+                    # for required options, and optional ones resolve to Python's None.
+                    if param_config.default is ... or param_config.default is _EMPTY_PARAMETER_SENTINEL:
                         param_config.default = None
-                    # If an optional option has an implicit default, normalize it to None
-                    # so it correctly resolves to Python's None if not provided.
-                    elif (not param_config.required) and (
-                        param_config.default is ... or param_config.default is _EMPTY_PARAMETER_SENTINEL
-                    ):
-                        param_config.default = None
-
-                    # Fallback logic for inferring 'required' if it was somehow None.
-                    # This case should ideally not be hit if `build_click_parameter`
-                    # always sets `required` to `True` or `False`.
+                    # Fallback for a `required` that was somehow left as None; such an
+                    # option is treated as optional.
                     elif param_config.required is None:
-                        # If a default value is explicitly provided (not None, Ellipsis, or _empty),
-                        # it's considered optional. Otherwise, default to optional.
-                        if (
-                            param_config.default is not None
-                            and param_config.default is not ...
-                            and param_config.default is not _EMPTY_PARAMETER_SENTINEL
-                        ):
-                            param_config.required = False
-                        else:
-                            param_config.required = False  # Defaulting to optional
-
-                if isinstance(param_config, click.Argument):
-                    if param_config.nargs == -1:
-                        # Variadic argument: keep it positional
-                        self._group.params.insert(0, param_config)
-                    else:
-                        if getattr(param_config, "_force_option", False):
-                            param_config = coerce_argument_to_option(param_config, force=True)
-                            self._group.params.insert(0, param_config)
-                        else:
-                            # Normal positional argument
-                            self._group.params.insert(0, param_config)
-                else:
-                    self._group.params.insert(0, param_config)
-
-            self._callbacks.append(stamped_function)
+                        param_config.required = False
+
+                    if param_config.required:
+                        self._required_callback_options.append(param_config)
+
+                # Variadic and normal positional arguments stay positional; only
+                # arguments flagged with `_force_option` are coerced to options.
+                if (
+                    isinstance(param_config, click.Argument)
+                    and param_config.nargs != -1
+                    and getattr(param_config, "_force_option", False)
+                ):
+                    param_config = coerce_argument_to_option(param_config, force=True)
+                group_parameters.append(param_config)
+
+            # Each parameter goes to the front of the group, so the last one ends up first.
+            # One slice assignment shifts the existing parameters once instead of per insert.
+            self._group.params[:0] = reversed(group_parameters)
+
+            if not self._callbacks:
+                self._install_callback_invoke()
+            self._callbacks.append((stamped_function, _build_callback_binder(stamped_function)))
             return func_to_decorate
 
         # Determine if the callback is being used directly as a decorator or as a decorator factory
@@ -407,8 +491,8 @@ class Sayer:
         Returns:
             The return value of the invoked command or callback.
         """
-        # Call the underlying Click group's run method
-        return self._group(prog_name=self._group.name, args=args)
+        # Call the underlying Click group's entry point directly
+        return self._group.main(args=args, prog_name=self._group.name)
 
     def add_command(self, cmd: click.Command | Any, name: str | None = None, is_custom: bool = False) -> None:
         """
@@ -426,7 +510,7 @@ class Sayer:
 
         # If it's a Group (vanilla or SayerGroup), mount it directly so it
         # subcommands survive
-        if isinstance(cmd, click.Group) or isinstance(cmd, BaseSayerCommand):
+        if isinstance(cmd, _MOUNTED_AS_IS_TYPES):
             is_custom_cmd = is_custom or getattr(cmd, "__is_custom__", False)
             name = name or cmd.name
             if name in self._registered_commands:
@@ -5,6 +5,7 @@ from typing import Annotated, get_args, get_origin
 import click
 
 from sayer.core.engine import group
+from sayer.core.utils import _cached_signature
 from sayer.params import Option
 from sayer.utils.ui import error, success
 
@@ -52,7 +53,7 @@ def render_cmd(full_name: str, cmd: click.Command) -> str:
 
     # Attempt to inspect original function for annotation-driven types
     orig_fn = getattr(cmd.callback, "_original_func", None)
-    orig_sig = inspect.signature(orig_fn) if orig_fn else None
+    orig_sig = _cached_signature(orig_fn) if orig_fn else None
 
     for p in cmd.params:
         # Name label
@@ -70,7 +71,7 @@ def render_cmd(full_name: str, cmd: click.Command) -> str:
         required = "Yes" if req else "No"
         # Default
         default = p.default
-        default_str = "" if default in (None, inspect._empty) else str(default)
+        default_str = "" if default is None or default is inspect._empty else str(default)
         # Description
         help_text = getattr(p, "help", "") or ""
         md.append(f"| {label} | {typestr} | {required} | {default_str} | {help_text} |")
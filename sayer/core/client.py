@@ -27,15 +27,13 @@ for alias, group_cmd in get_groups().items():
     # Ensure the group itself is using SayerGroup
     group_cmd.cls = app.cli.__class__
 
-    # Capture existing subcommands
-    original = list(group_cmd.commands.items())
-    # Remove them so we can re-add wrapped versions
-    for name, _ in original:
-        group_cmd.commands.pop(name)
-
-    # Re-add each as SayerCommand
-    for name, cmd in original:
-        group_cmd.add_command(wrap_click_command(cmd, command_class=SayerCommand), name=name)
+    # Re-add each foreign command as SayerCommand. Commands that already are
+    # SayerCommand instances are kept as they are. Re-registering an existing
+    # name replaces the entry in place, so the original order is kept.
+    for name, cmd in list(group_cmd.commands.items()):
+        wrapped = wrap_click_command(cmd, command_class=SayerCommand)
+        if wrapped is not cmd:
+            group_cmd.add_command(wrapped, name=name)
 
     # Finally register the group under the main CLI
     app.cli.add_command(group_cmd, name=alias)
@@ -1,10 +1,10 @@
-import inspect
 from typing import Any
 
 import click
 
 from sayer.core.commands.base import BaseSayerCommand
 from sayer.core.console.loader import render_help
+from sayer.core.utils import _cached_signature
 from sayer.state import State
 
 
@@ -39,7 +39,7 @@ class SayerCommand(BaseSayerCommand):
                 if original is None:
                     raise TypeError("Positional arguments are not supported for this command.")
 
-                signature = inspect.signature(original)
+                signature = _cached_signature(original)
                 # Build the ordered list of user-facing parameters (exclude injected ones)
                 ordered_params = []
                 for p in signature.parameters.values():
@@ -233,7 +233,7 @@ class RichHelpFormatter:
             required_str = "Yes" if getattr(param, "required", False) else "No"
 
             default_val = getattr(param, "default", inspect._empty)
-            if default_val in (inspect._empty, None, ...):
+            if default_val is inspect._empty or default_val is None or default_val is ...:
                 default_str = ""
             elif isinstance(default_val, bool):
                 default_str = "true" if default_val else "false"
@@ -2,15 +2,14 @@ import inspect
 import json
 from collections.abc import Callable
 from functools import wraps
+from types import CoroutineType
 from typing import (
     Annotated,
     Any,
+    NamedTuple,
     Sequence,
     TypeVar,
     cast,
-    get_args,
-    get_origin,
-    get_type_hints,
     overload,
 )
 
@@ -32,17 +31,70 @@ from sayer.core.handlers import (
     _handle_special_types,
     _handle_variadic_args,
 )
-from sayer.core.utils import CommandRegistry, _extract_command_help_text, convert_cli_value_to_type
+from sayer.core.utils import (
+    CommandRegistry,
+    _cached_signature,
+    _cached_type_hints,
+    _extract_command_help_text,
+    _kebab_case,
+    _origin_and_args,
+    convert_cli_value_to_type,
+)
 from sayer.encoders import apply_structure
 from sayer.middleware import resolve as resolve_middleware, run_after, run_before
-from sayer.params import Argument, Env, JsonParam, Option, Param
-from sayer.state import State, get_state_classes
+from sayer.params import Argument, BaseParam, Env, JsonParam, Option, Param
+from sayer.state import get_state_classes, is_state_class
 
 F = TypeVar("F", bound=Callable[..., Any])
 
 COMMANDS: CommandRegistry[str, click.Command] = CommandRegistry()
 GROUPS: dict[str, click.Group] = {}
 
+# How `command` fills each parameter of the decorated function at invocation.
+_BIND_VALUE = 0
+_BIND_CONTEXT = 1
+_BIND_STATE = 2
+
+
+class _ParameterBinding(NamedTuple):
+    """How the command wrapper fills one parameter of the decorated function."""
+
+    name: str
+    annotation: Any
+    kind: int = _BIND_VALUE
+    # The remaining fields only apply to `_BIND_VALUE` parameters.
+    target_type: Any = None
+    is_json: bool = False
+    is_sequence: bool = False
+    item_type: Any = None
+
+
+# Sayer's parameter metadata classes. Exact instances are matched with a hash lookup;
+# subclasses still match via `isinstance`, behind a single `BaseParam` check that
+# rejects plain defaults and help strings.
+_PARAMETER_METADATA_TYPES = (Option, Argument, Env, Param, JsonParam)
+_PARAMETER_METADATA_CLASSES = frozenset(_PARAMETER_METADATA_TYPES)
+
+
+def _is_parameter_metadata(value: Any) -> bool:
+    """Returns whether `value` is an `Option`, `Argument`, `Env`, `Param` or `JsonParam`."""
+    return type(value) in _PARAMETER_METADATA_CLASSES or (
+        isinstance(value, BaseParam) and isinstance(value, _PARAMETER_METADATA_TYPES)
+    )
+
+
+def _split_parameter_annotation(annotation: Any) -> tuple[Any, tuple[Any, ...]]:
+    """
+    Splits a parameter annotation into `(base_type, annotated_metadata)`.
+
+    `Annotated[T, ...]` yields `T` and its metadata arguments; any other annotation
+    yields itself and no metadata.
+    """
+    origin, args = _origin_and_args(annotation)
+    if origin is Annotated:
+        return args[0], args[1:]
+    return annotation, ()
+
 
 def build_click_parameter(
     parameter: inspect.Parameter,
@@ -185,18 +237,21 @@ def command(
 
     def command_decorator(function_to_decorate: F) -> click.Command:
         # Convert function name to a kebab-case command name (e.g., "my_command" -> "my-command").
-        default_name = function_to_decorate.__name__.replace("_", "-")
+        default_name = _kebab_case(function_to_decorate.__name__)
         command_name = attrs.pop("name", name_from_pos) or default_name
         # Inspect the function's signature to get parameter information.
-        function_signature = inspect.signature(function_to_decorate)
+        function_signature = _cached_signature(function_to_decorate)
         # Get type hints for the function parameters, resolving any `Annotated` types.
-        type_hints = get_type_hints(function_to_decorate, include_extras=True)
+        type_hints = _cached_type_hints(function_to_decorate)
         # Extract help text for the command from various sources.
         command_help_text = _extract_command_help_text(function_signature, function_to_decorate, attrs)
         # Resolve before and after middleware hooks.
         before_execution_hooks, after_execution_hooks = resolve_middleware(middleware)
         # Check if `click.Context` is explicitly injected into the function's parameters.
-        is_context_param_injected = any(p.annotation is click.Context for p in function_signature.parameters.values())
+        # Materialized once; the context check, the binding plan and the parameter
+        # attachment below all walk the same parameters.
+        signature_parameters = tuple(function_signature.parameters.values())
+        is_context_param_injected = any(p.annotation is click.Context for p in signature_parameters)
         # Checks if should be a custom group to added
 
         click_cmd_kwargs = {
@@ -210,6 +265,71 @@ def command(
         # This will allow to naturally call a command as a normal function
         click_cmd_kwargs.setdefault("cls", SayerCommand)
 
+        # --- Binding plan ---
+        # Everything the wrapper needs to know about each parameter is resolved once
+        # here, so an invocation only walks these precomputed entries.
+        default_factory_parameters: list[tuple[str, Option | Env]] = []
+        # Each annotation is split once. The binding plan reads the annotation as written,
+        # since on Python 3.10 `get_type_hints` turns `x: Annotated[T, ...] = None` into
+        # `Optional[Annotated[T, ...]]` and hides its metadata. The parameter attachment
+        # reads the resolved type hint, which is usually the same object and shares the split.
+        written_annotations: dict[str, tuple[Any, Any, tuple[Any, ...]]] = {}
+        resolved_annotations: dict[str, tuple[Any, Any, tuple[Any, ...]]] = {}
+        for param_sig in signature_parameters:
+            written_annotation = param_sig.annotation if param_sig.annotation is not inspect._empty else str
+            resolved_annotation = type_hints.get(param_sig.name, written_annotation)
+            written_split = (written_annotation, *_split_parameter_annotation(written_annotation))
+            written_annotations[param_sig.name] = written_split
+            resolved_annotations[param_sig.name] = (
+                written_split
+                if resolved_annotation is written_annotation
+                else (resolved_annotation, *_split_parameter_annotation(resolved_annotation))
+            )
+
+        binding_plan: list[_ParameterBinding] = []
+        for param_sig in signature_parameters:
+            # `click.Context` and `State` parameters are injected rather than converted.
+            if param_sig.annotation is click.Context:
+                binding_plan.append(_ParameterBinding(param_sig.name, param_sig.annotation, _BIND_CONTEXT))
+                continue
+            if is_state_class(param_sig.annotation):
+                binding_plan.append(_ParameterBinding(param_sig.name, param_sig.annotation, _BIND_STATE))
+                continue
+
+            # The conversion target is the type inside `Annotated`, defaulting to `str`.
+            raw_type_for_conversion, target_type_for_conversion, annotated_metadata = written_annotations[
+                param_sig.name
+            ]
+            raw_origin, raw_args = _origin_and_args(raw_type_for_conversion)
+
+            # Look for `Option`/`Env` metadata carrying a `default_factory`, first within
+            # the `Annotated` arguments and then in the default value.
+            param_metadata_for_factory = None
+            for meta_item in annotated_metadata:
+                if isinstance(meta_item, (Option, Env)):
+                    param_metadata_for_factory = meta_item
+                    break
+            if param_metadata_for_factory is None and isinstance(param_sig.default, (Option, Env)):
+                param_metadata_for_factory = param_sig.default
+            if param_metadata_for_factory is not None and getattr(param_metadata_for_factory, "default_factory", None):
+                default_factory_parameters.append((param_sig.name, param_metadata_for_factory))
+
+            is_json_param = isinstance(param_sig.default, JsonParam) or any(
+                isinstance(meta, JsonParam) for meta in annotated_metadata
+            )
+            is_sequence_param = raw_origin in (list, Sequence)
+            sequence_item_type = (raw_args[0] if raw_args else Any) if is_sequence_param else None
+            binding_plan.append(
+                _ParameterBinding(
+                    param_sig.name,
+                    param_sig.annotation,
+                    target_type=target_type_for_conversion,
+                    is_json=is_json_param,
+                    is_sequence=is_sequence_param,
+                    item_type=sequence_item_type,
+                )
+            )
+
         @click.command(**click_cmd_kwargs)  # type: ignore
         @click.pass_context
         @wraps(function_to_decorate)
@@ -247,86 +367,51 @@ def command(
                 ctx._sayer_state = state_cache  # type: ignore
 
             # --- Dynamic default_factory injection ---
-            for param_sig in function_signature.parameters.values():
-                # Skip `click.Context` and `State` parameters as they are handled separately.
-                if param_sig.annotation is click.Context:
-                    continue
-                if isinstance(param_sig.annotation, type) and issubclass(param_sig.annotation, State):
-                    continue
-
-                param_metadata_for_factory = None
-                # Resolve the raw type, handling `Annotated` parameters.
-                raw_annotation_for_factory = param_sig.annotation if param_sig.annotation is not inspect._empty else str
-                if get_origin(raw_annotation_for_factory) is Annotated:
-                    # Look for metadata (Option, Env) within Annotated arguments.
-                    for meta_item in get_args(raw_annotation_for_factory)[1:]:
-                        if isinstance(meta_item, (Option, Env)):
-                            param_metadata_for_factory = meta_item
-                            break
-                # If no metadata found in Annotated, check if the default value is metadata.
-                if param_metadata_for_factory is None and isinstance(param_sig.default, (Option, Env)):
-                    param_metadata_for_factory = param_sig.default
-
-                # If metadata with a `default_factory` is found and no value was provided
-                # via the CLI, call the factory to get the default.
-                if isinstance(param_metadata_for_factory, (Option, Env)) and getattr(
-                    param_metadata_for_factory, "default_factory", None
-                ):
-                    if not kwargs.get(param_sig.name):
-                        kwargs[param_sig.name] = param_metadata_for_factory.default_factory()
+            # If no value was provided via the CLI, call the factory to get the default.
+            for param_name, factory_metadata in default_factory_parameters:
+                if not kwargs.get(param_name):
+                    kwargs[param_name] = factory_metadata.default_factory()
 
             # --- Bind & convert arguments ---
             bound_arguments: dict[str, Any] = {}
-            for param_sig in function_signature.parameters.values():
+            for binding in binding_plan:
+                param_name = binding.name
                 # Inject `click.Context` if requested.
-                if param_sig.annotation is click.Context:
-                    bound_arguments[param_sig.name] = ctx
+                if binding.kind == _BIND_CONTEXT:
+                    bound_arguments[param_name] = ctx
                     continue
                 # Inject `sayer.State` instances if requested.
-                if isinstance(param_sig.annotation, type) and issubclass(param_sig.annotation, State):
-                    bound_arguments[param_sig.name] = ctx._sayer_state[param_sig.annotation]  # type: ignore
+                if binding.kind == _BIND_STATE:
+                    bound_arguments[param_name] = ctx._sayer_state[binding.annotation]  # type: ignore
                     continue
 
-                # Determine the target type for conversion, handling `Annotated` and default `str`.
-                raw_type_for_conversion = param_sig.annotation if param_sig.annotation is not inspect._empty else str
-                target_type_for_conversion = (
-                    get_args(raw_type_for_conversion)[0]
-                    if get_origin(raw_type_for_conversion) is Annotated
-                    else raw_type_for_conversion
-                )
-                parameter_value = kwargs.get(param_sig.name)
+                parameter_value = kwargs.get(param_name)
 
                 # Special handling for explicit `JsonParam` or `Annotated` with `JsonParam`.
-                is_json_param_by_default = isinstance(param_sig.default, JsonParam)
-                is_json_param_by_annotation = get_origin(param_sig.annotation) is Annotated and any(
-                    isinstance(meta, JsonParam) for meta in get_args(param_sig.annotation)[1:]
-                )
-                if is_json_param_by_default or is_json_param_by_annotation:
-                    if isinstance(parameter_value, str):
-                        try:
-                            # Attempt to load JSON string and then apply structure.
-                            json_data = json.loads(parameter_value)
-                        except json.JSONDecodeError as e:
-                            # Raise a Click `BadParameter` error on JSON decoding failure.
-                            raise click.BadParameter(f"Invalid JSON for '{param_sig.name}': {e}") from e
-                        parameter_value = apply_structure(target_type_for_conversion, json_data)
+                if binding.is_json and isinstance(parameter_value, str):
+                    try:
+                        # Attempt to load JSON string and then apply structure.
+                        json_data = json.loads(parameter_value)
+                    except json.JSONDecodeError as e:
+                        # Raise a Click `BadParameter` error on JSON decoding failure.
+                        raise click.BadParameter(f"Invalid JSON for '{param_name}': {e}") from e
+                    parameter_value = apply_structure(binding.target_type, json_data)
 
                 # Convert non-list/Sequence types using the `convert_cli_value_to_type` helper.
-                if get_origin(raw_type_for_conversion) in (list, Sequence):
-                    inner = get_args(raw_type_for_conversion)[0] if get_args(raw_type_for_conversion) else Any
+                if binding.is_sequence:
                     parameter_value = [
-                        convert_cli_value_to_type(item, inner, function_to_decorate, param_sig.name)
+                        convert_cli_value_to_type(item, binding.item_type, function_to_decorate, param_name)
                         for item in (parameter_value or [])
                     ]
                 else:
                     parameter_value = convert_cli_value_to_type(
                         parameter_value,
-                        target_type_for_conversion,
+                        binding.target_type,
                         function_to_decorate,
-                        param_sig.name,
+                        param_name,
                     )
 
-                bound_arguments[param_sig.name] = parameter_value
+                bound_arguments[param_name] = parameter_value
 
             # --- Before hooks ---
             for hook_func in before_execution_hooks:
@@ -340,7 +425,7 @@ def command(
             # --- Execute command ---
             execution_result = function_to_decorate(**bound_arguments)
             # If the function is a coroutine, run it using `anyio`.
-            if inspect.iscoroutine(execution_result):
+            if isinstance(execution_result, CoroutineType):
                 # If in AnyIO context create a coroutine to run later
                 if is_natural_call:
 
@@ -381,11 +466,9 @@ def command(
 
         # Attach parameters to the Click command.
         # Iterate through the original function's parameters to build Click options/arguments.
-        for param_inspect_obj in function_signature.parameters.values():
+        for param_inspect_obj in signature_parameters:
             # Skip `click.Context` and `sayer.State` parameters as they are handled internally.
-            if param_inspect_obj.annotation is click.Context or (
-                isinstance(param_inspect_obj.annotation, type) and issubclass(param_inspect_obj.annotation, State)
-            ):
+            if param_inspect_obj.annotation is click.Context or is_state_class(param_inspect_obj.annotation):
                 continue
 
             # Respect existing click decorators on the function (e.g. @click.argument / @click.option)
@@ -394,30 +477,19 @@ def command(
                 continue
 
             # Determine the raw annotation and the primary parameter type.
-            raw_annotation_for_param = type_hints.get(
-                param_inspect_obj.name,
-                (param_inspect_obj.annotation if param_inspect_obj.annotation is not inspect._empty else str),
-            )
-            param_base_type = (
-                get_args(raw_annotation_for_param)[0]
-                if get_origin(raw_annotation_for_param) is Annotated
-                else raw_annotation_for_param
-            )
+            raw_annotation_for_param, param_base_type, annotated_metadata = resolved_annotations[param_inspect_obj.name]
 
             param_metadata_for_build = None
             param_help_for_build = ""
             # Extract parameter metadata and help text from `Annotated` types.
-            if get_origin(raw_annotation_for_param) is Annotated:
-                for meta_item in get_args(raw_annotation_for_param)[1:]:
-                    if isinstance(meta_item, (Option, Argument, Env, Param, JsonParam)):
-                        param_metadata_for_build = meta_item
-                        param_help_for_build = getattr(meta_item, "help", "") or ""
-                    elif isinstance(meta_item, str):
-                        param_help_for_build = meta_item
+            for meta_item in annotated_metadata:
+                if _is_parameter_metadata(meta_item):
+                    param_metadata_for_build = meta_item
+                    param_help_for_build = getattr(meta_item, "help", "") or ""
+                elif isinstance(meta_item, str):
+                    param_help_for_build = meta_item
             # If no metadata found in `Annotated`, check if the default value is metadata.
-            if param_metadata_for_build is None and isinstance(
-                param_inspect_obj.default, (Param, Option, Argument, Env, JsonParam)
-            ):
+            if param_metadata_for_build is None and _is_parameter_metadata(param_inspect_obj.default):
                 param_metadata_for_build = param_inspect_obj.default
 
             # Extract the type and override it
@@ -439,9 +511,10 @@ def command(
             )
 
         # Register the command.
-        if hasattr(function_to_decorate, "__sayer_group__"):
+        owning_group = getattr(function_to_decorate, "__sayer_group__", None)
+        if owning_group is not None:
             # If the function is part of a `sayer` group, add it to that group.
-            function_to_decorate.__sayer_group__.add_command(current_wrapper)
+            owning_group.add_command(current_wrapper)
         else:
             # Otherwise, add it to the global command registry.
             COMMANDS[command_name] = current_wrapper
@@ -583,6 +656,10 @@ def bind_command_to_group(group_instance: click.Group, function_to_bind: F, *arg
     return cast(click.Command, decorator)
 
 
+# Click's own `Group.command`. A reload of this module re-runs this line with the
+# patched method in place, so the original captured on first import is kept.
+_ORIGINAL_CLICK_GROUP_COMMAND = globals().get("_ORIGINAL_CLICK_GROUP_COMMAND", click.Group.command)
+
 # Monkey-patch Click so that all groups use Sayer's binding logic:
 # This crucial line ensures that any `click.Group` created (even outside
 # `sayer.group`) will use `sayer`'s `bind_command_to_group` when its `.command`
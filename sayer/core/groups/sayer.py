@@ -1,5 +1,6 @@
 import click
 
+from sayer.core.console.loader import render_help
 from sayer.core.groups.base import BaseSayerGroup
 
 
@@ -27,9 +28,5 @@ class SayerGroup(BaseSayerGroup):
             formatter: An optional Click `HelpFormatter` instance (though ignored
                        as Sayer uses its own rendering).
         """
-        from sayer.core.console.loader import (
-            render_help,
-        )
-
         # Delegate the help rendering to Sayer's custom help function.
         render_help(ctx, self.display_full_help, self.display_help_length)
@@ -14,13 +14,12 @@ from typing import (
     Sequence,
     Union,
     cast,
-    get_args,
-    get_origin,
 )
 from uuid import UUID
 
 import click
 
+from sayer.core.utils import _long_option_name, _origin_and_args
 from sayer.encoders import MoldingProtocol, get_encoders
 from sayer.params import Argument, Env, JsonParam, Option, Param
 
@@ -37,6 +36,18 @@ PRIMITIVE_TYPE_MAP = {
 SUPPORTS_HIDDEN = "hidden" in inspect.signature(click.Option).parameters
 
 
+def _last_added_parameter(wrapped: Any) -> click.Parameter:
+    """
+    Returns the parameter a Click decorator just attached to `wrapped`.
+
+    Click appends to `Command.params` when decorating a command and to
+    `__click_params__` when decorating a plain function.
+    """
+    if isinstance(wrapped, click.Command):
+        return wrapped.params[-1]
+    return wrapped.__click_params__[-1]
+
+
 def _iter_option_decl_aliases(option_decls: tuple[str, ...]) -> tuple[str, ...]:
     aliases: list[str] = []
     for declaration in option_decls:
@@ -133,12 +144,14 @@ class ParameterContext:
         It serves to establish the final state of context properties that guide
         the Click parameter construction process.
         """
-        self.expose = getattr(self.metadata, "expose_value", True)
+        # Metadata is one of the `sayer.params` classes, which always define these attributes
+        self.expose = True if self.metadata is None else self.metadata.expose_value
         self.hidden = not self.expose
 
         # restore compatibility
-        self.has_default = self.parameter.default not in (inspect._empty, Ellipsis)
-        self.default = self.parameter.default if self.has_default else None
+        default = self.parameter.default
+        self.has_default = default is not inspect._empty and default is not Ellipsis
+        self.default = default if self.has_default else None
 
         self.resolved_default = self._resolve_default()
         self.is_required = self._resolve_required()
@@ -156,23 +169,23 @@ class ParameterContext:
         Returns:
             The final default value to be used by Click, or `None`.
         """
-        if self.metadata is not None:
-            if getattr(self.metadata, "default_factory", None):
+        metadata = self.metadata
+        if metadata is not None:
+            if metadata.default_factory:
                 return None
 
-            meta_default = getattr(self.metadata, "default", Ellipsis)
-            if meta_default not in (Ellipsis, inspect._empty):
+            meta_default = metadata.default
+            if meta_default is not Ellipsis and meta_default is not inspect._empty:
                 # Ignore if someone accidentally stuffs another metadata object as a default
                 if isinstance(meta_default, (Option, Argument, Param, Env, JsonParam)):
                     return None
                 return meta_default
 
-            if isinstance(self.metadata, Option) and getattr(self.metadata, "envvar", None):
-                meta_default_marker = getattr(self.metadata, "default", Ellipsis)
-                if meta_default_marker in (Ellipsis, inspect._empty, None):
-                    env_val = os.getenv(self.metadata.envvar)
-                    if env_val is not None:
-                        return env_val
+            # No explicit metadata default at this point, so an Option may fall back to its envvar
+            if isinstance(metadata, Option) and metadata.envvar:
+                env_val = os.getenv(metadata.envvar)
+                if env_val is not None:
+                    return env_val
 
         if self.has_default:
             # Keep falsy defaults like 0, "", [] — don't treat as missing
@@ -195,17 +208,15 @@ class ParameterContext:
         Returns:
             True if the parameter is required, False otherwise.
         """
-        if isinstance(self.metadata, (Param, Option, Argument, Env)):
-            if getattr(self.metadata, "required", None) is True:
+        metadata = self.metadata
+        if isinstance(metadata, (Param, Option, Argument, Env)):
+            if metadata.required is True:
                 return True
-            if getattr(self.metadata, "required", None) is False:
+            if metadata.required is False:
                 return False  # <-- explicit False must be respected
 
-            has_metadata_default = getattr(self.metadata, "default", Ellipsis) not in (
-                Ellipsis,
-                inspect._empty,
-                Ellipsis,
-            )
+            metadata_default = metadata.default
+            has_metadata_default = metadata_default is not Ellipsis and metadata_default is not inspect._empty
             if not (self.has_default or has_metadata_default):
                 return True
             return False
@@ -228,16 +239,15 @@ class ParameterContext:
            suggests it should be treated as a Click option rather than a positional argument,
            and converts the `Param` metadata to `Option` metadata in-place if necessary.
         """
-        origin = get_origin(self.base_type)
+        origin, args = _origin_and_args(self.base_type)
         if origin in (Union, types.UnionType):
-            args = get_args(self.base_type)
             non_none = [t for t in args if t is not type(None)]
             if len(non_none) == 1:
                 self.base_type = non_none[0]
 
         if (
             isinstance(self.metadata, Param)
-            and get_origin(self.raw_type_annotation) is Annotated
+            and _origin_and_args(self.raw_type_annotation)[0] is Annotated
             and _should_parameter_use_option_style(self.metadata, self.default)
         ):
             self.metadata = self.metadata.as_option()
@@ -303,9 +313,8 @@ def _handle_variadic_args(ctx: ParameterContext) -> Optional[Callable]:
         matches the implicit variadic argument pattern, otherwise `None` to pass
         control to the next handler.
     """
-    base_origin = get_origin(ctx.base_type)
+    base_origin, inner_args = _origin_and_args(ctx.base_type)
     if ctx.metadata is None and base_origin in (list, tuple) and ctx.parameter.name in {"args", "argv"}:
-        inner_args = get_args(ctx.base_type)
         inner_type = inner_args[0] if inner_args else str
         click_inner_type = PRIMITIVE_TYPE_MAP.get(inner_type, click.STRING)
         return click.argument(
@@ -346,11 +355,10 @@ def _handle_sequence(ctx: ParameterContext) -> Optional[Callable]:
         A callable (the configured Click decorator) if the parameter is a
         sequence type, otherwise `None` to pass control to the next handler.
     """
-    base_origin = get_origin(ctx.base_type)
+    base_origin, inner_args = _origin_and_args(ctx.base_type)
     if base_origin not in (list, Sequence):
         return None
 
-    inner_args = get_args(ctx.base_type)
     inner_type = inner_args[0] if inner_args else str
     click_inner_type = PRIMITIVE_TYPE_MAP.get(inner_type, click.STRING)
 
@@ -393,7 +401,7 @@ def _handle_sequence(ctx: ParameterContext) -> Optional[Callable]:
         md_decl = (*shorts, *longs, *others) if (shorts and longs) else md_decl
 
     # Always include a long alias derived from the parameter name (e.g., --store)
-    name_long = f"--{ctx.parameter.name.replace('_', '-')}"
+    name_long = _long_option_name(ctx.parameter.name)
     if md_decl:
         if not _has_long_option_decl(md_decl, name_long):
             md_decl = (*md_decl, name_long)
@@ -480,7 +488,7 @@ def _handle_enum(ctx: ParameterContext) -> Optional[Callable]:
     if SUPPORTS_HIDDEN:
         kwargs["hidden"] = ctx.hidden
 
-    return click.option(f"--{ctx.parameter.name.replace('_', '-')}", **kwargs)(ctx.wrapper)
+    return click.option(_long_option_name(ctx.parameter.name), **kwargs)(ctx.wrapper)
 
 
 def _handle_json(ctx: ParameterContext) -> Optional[Callable]:
@@ -539,7 +547,7 @@ def _handle_json(ctx: ParameterContext) -> Optional[Callable]:
             kwargs["hidden"] = ctx.hidden
 
         return click.option(
-            f"--{ctx.parameter.name.replace('_', '-')}",
+            _long_option_name(ctx.parameter.name),
             **cast(dict[str, Any], kwargs),
         )(ctx.wrapper)
     return None
@@ -641,11 +649,8 @@ def _handle_argument(ctx: ParameterContext) -> Optional[Callable]:
     )
     wrapped = click.argument(ctx.parameter.name, **arg_kwargs)(ctx.wrapper)
 
-    help_text = getattr(ctx.metadata, "help", "")
-    if hasattr(wrapped, "params"):
-        for param_obj in wrapped.params:
-            if isinstance(param_obj, click.Argument) and param_obj.name == ctx.parameter.name:
-                param_obj.help = help_text
+    if isinstance(wrapped, click.Command):
+        _last_added_parameter(wrapped).help = getattr(ctx.metadata, "help", "")
     return wrapped
 
 
@@ -697,7 +702,7 @@ def _handle_env(ctx: ParameterContext) -> Optional[Callable]:
         kwargs["hidden"] = ctx.hidden
 
     return click.option(
-        f"--{ctx.parameter.name.replace('_', '-')}",
+        _long_option_name(ctx.parameter.name),
         **kwargs,
     )(ctx.wrapper)
 
@@ -734,14 +739,14 @@ def _handle_option(ctx: ParameterContext) -> Optional[Callable]:
         return None
 
     raw_for_option = ctx.raw_type_annotation
-    if get_origin(raw_for_option) is Annotated:
-        ann_args = get_args(raw_for_option)
-        if ann_args:
-            raw_for_option = ann_args[0]
+    option_origin, ann_args = _origin_and_args(raw_for_option)
+    if option_origin is Annotated and ann_args:
+        raw_for_option = ann_args[0]
+        option_origin, ann_args = _origin_and_args(raw_for_option)
 
     # unwrap Optional[T]
-    if get_origin(raw_for_option) in (Union, types.UnionType):
-        union_args = get_args(raw_for_option)
+    if option_origin in (Union, types.UnionType):
+        union_args = ann_args
         if type(None) in union_args:
             non_none = [a for a in union_args if a is not type(None)]
             if len(non_none) == 1:
@@ -774,7 +779,7 @@ def _handle_option(ctx: ParameterContext) -> Optional[Callable]:
         md_decl = (*shorts, *longs, *others) if (shorts and longs) else md_decl
 
     # Always include a long alias derived from the parameter name (e.g., --param-name)
-    name_long = f"--{ctx.parameter.name.replace('_', '-')}"
+    name_long = _long_option_name(ctx.parameter.name)
     if md_decl:
         if not _has_long_option_decl(md_decl, name_long):
             md_decl = (*md_decl, name_long)
@@ -869,7 +874,7 @@ def _handle_boolean_flag(ctx: ParameterContext) -> Optional[Callable]:
         kwargs["hidden"] = ctx.hidden
 
     return click.option(
-        f"--{ctx.parameter.name.replace('_', '-')}",
+        _long_option_name(ctx.parameter.name),
         **cast(dict[str, Any], kwargs),
     )(ctx.wrapper)
 
@@ -925,7 +930,7 @@ def _handle_defaults(ctx: ParameterContext) -> Optional[Callable]:
         if SUPPORTS_HIDDEN:
             kwargs["hidden"] = ctx.hidden
         return click.option(
-            f"--{ctx.parameter.name.replace('_', '-')}",
+            _long_option_name(ctx.parameter.name),
             **kwargs,
         )(ctx.wrapper)
 
@@ -940,7 +945,7 @@ def _handle_defaults(ctx: ParameterContext) -> Optional[Callable]:
         if SUPPORTS_HIDDEN:
             kwargs["hidden"] = ctx.hidden
         return click.option(
-            f"--{ctx.parameter.name.replace('_', '-')}",
+            _long_option_name(ctx.parameter.name),
             **kwargs,
         )(ctx.wrapper)
 
@@ -956,7 +961,7 @@ def _handle_defaults(ctx: ParameterContext) -> Optional[Callable]:
         if SUPPORTS_HIDDEN:
             kwargs["hidden"] = ctx.hidden
         return click.option(
-            f"--{ctx.parameter.name.replace('_', '-')}",
+            _long_option_name(ctx.parameter.name),
             **kwargs,
         )(ctx.wrapper)
 
@@ -968,8 +973,7 @@ def _handle_defaults(ctx: ParameterContext) -> Optional[Callable]:
         required=False,
     )(ctx.wrapper)
 
-    for param in wrapped.params:
-        if param.name == ctx.parameter.name:
-            param.required = False
-            param.default = final_default
+    added_parameter = _last_added_parameter(wrapped)
+    added_parameter.required = False
+    added_parameter.default = final_default
     return wrapped
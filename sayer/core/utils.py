@@ -3,12 +3,15 @@ from __future__ import annotations
 import inspect
 import sys
 import types
+import weakref
 from datetime import date, datetime
 from enum import Enum
+from functools import lru_cache
 from typing import (
     Annotated,
     Any,
     Callable,
+    ForwardRef,
     Literal,
     Mapping,
     TypeVar,
@@ -29,6 +32,11 @@ except ImportError:  # py<3.10
 T = TypeVar("T")
 V = TypeVar("V")
 
+# Introspection results keyed weakly by function, so decorating or re-stamping the
+# same function does not resolve its signature and hints again.
+_SIGNATURE_CACHE: weakref.WeakKeyDictionary[Callable[..., Any], inspect.Signature] = weakref.WeakKeyDictionary()
+_TYPE_HINTS_CACHE: weakref.WeakKeyDictionary[Callable[..., Any], dict[str, Any]] = weakref.WeakKeyDictionary()
+
 
 def _split_csv_items(value: str) -> list[str]:
     """Split a comma-separated CLI value into normalized tokens."""
@@ -56,10 +64,121 @@ class CommandRegistry(dict[T, V]):
         ...
 
 
+# Before 3.11, `get_type_hints` also wraps parameters defaulting to `None` in `Optional`,
+# so the raw `__annotations__` are only equivalent to its result from 3.11 onwards.
+_RAW_ANNOTATIONS_MATCH_TYPE_HINTS = sys.version_info >= (3, 11)
+
+
+def _needs_type_hint_resolution(annotation: Any) -> bool:
+    """
+    Returns whether `annotation` contains a string or `ForwardRef` anywhere, i.e.
+    whether `get_type_hints` would evaluate something rather than return it as is.
+    """
+    if isinstance(annotation, (str, ForwardRef)):
+        return True
+    if isinstance(annotation, list):
+        # `Callable[[...], ...]` keeps its parameter types in a plain list
+        return any(_needs_type_hint_resolution(item) for item in annotation)
+    return any(_needs_type_hint_resolution(arg) for arg in get_args(annotation))
+
+
+def _resolve_type_hints(func: Callable[..., Any]) -> dict[str, Any]:
+    """
+    Equivalent of `get_type_hints(func, include_extras=True)` that reads the raw
+    `__annotations__` when they are already fully evaluated objects.
+    """
+    annotations = func.__annotations__
+    if (
+        _RAW_ANNOTATIONS_MATCH_TYPE_HINTS
+        and inspect.isfunction(func)
+        and not any(_needs_type_hint_resolution(annotation) for annotation in annotations.values())
+    ):
+        return {name: type(None) if annotation is None else annotation for name, annotation in annotations.items()}
+    return get_type_hints(func, include_extras=True)
+
+
+def _cached_signature(func: Callable[..., Any]) -> inspect.Signature:
+    """
+    Returns `inspect.signature(func)`, computed once per function.
+
+    Callables that cannot be weakly referenced are inspected on every call.
+    """
+    try:
+        return _SIGNATURE_CACHE[func]
+    except KeyError:
+        signature = _SIGNATURE_CACHE[func] = inspect.signature(func)
+        return signature
+    except TypeError:
+        return inspect.signature(func)
+
+
+def _cached_type_hints(func: Callable[..., Any]) -> dict[str, Any]:
+    """
+    Returns `get_type_hints(func, include_extras=True)`, computed once per function.
+
+    The returned dict is shared between callers and must not be mutated. Callables
+    that cannot be weakly referenced are resolved on every call.
+    """
+    if not getattr(func, "__annotations__", None):
+        # Nothing to resolve; skip the namespace lookups `get_type_hints` performs.
+        return {}
+    try:
+        return _TYPE_HINTS_CACHE[func]
+    except KeyError:
+        type_hints = _TYPE_HINTS_CACHE[func] = _resolve_type_hints(func)
+        return type_hints
+    except TypeError:
+        return _resolve_type_hints(func)
+
+
+# `id(annotation) -> (annotation, (origin, args))`. Keyed by identity because typing
+# treats some distinct annotations as equal (e.g. `Union[int, str] == Union[str, int]`),
+# while their args keep the order they were written in. Holding the annotation keeps
+# its id from being reused while the entry exists.
+_ORIGIN_AND_ARGS_CACHE: dict[int, tuple[Any, tuple[Any, tuple[Any, ...]]]] = {}
+_ORIGIN_AND_ARGS_CACHE_SIZE = 1024
+
+
+def _origin_and_args(annotation: Any) -> tuple[Any, tuple[Any, ...]]:
+    """
+    Returns `(get_origin(annotation), get_args(annotation))`, memoized per annotation object.
+
+    Commands tend to repeat the same annotation objects (e.g. a shared
+    `Annotated[str, Option()]` alias), so the typing structure is walked once per object.
+    """
+    entry = _ORIGIN_AND_ARGS_CACHE.get(id(annotation))
+    if entry is not None and entry[0] is annotation:
+        return entry[1]
+
+    result = get_origin(annotation), get_args(annotation)
+    if len(_ORIGIN_AND_ARGS_CACHE) >= _ORIGIN_AND_ARGS_CACHE_SIZE:
+        _ORIGIN_AND_ARGS_CACHE.clear()
+    _ORIGIN_AND_ARGS_CACHE[id(annotation)] = (annotation, result)
+    return result
+
+
+_KEBAB_CASE_TABLE = str.maketrans("_", "-")
+
+
+@lru_cache(maxsize=1024)
+def _kebab_case(name: str) -> str:
+    """Returns the CLI spelling of a Python identifier, e.g. `dry_run` -> `dry-run`."""
+    return name.translate(_KEBAB_CASE_TABLE)
+
+
+@lru_cache(maxsize=1024)
+def _long_option_name(name: str) -> str:
+    """Returns the long option declaration for a parameter name, e.g. `dry_run` -> `--dry-run`."""
+    return f"--{_kebab_case(name)}"
+
+
 def _safe_get_type_hints(func: Any, *, include_extras: bool = True) -> Mapping[str, Any]:
     """
     Robust type-hint resolver that tolerates dynamically loaded modules and missing sys.modules entries.
     """
+    if not getattr(func, "__annotations__", None):
+        return {}
+
     # Prefer the module inspect finds. Fall back to the function's globals
     mod = inspect.getmodule(func)
     globalns = getattr(mod, "__dict__", None) or getattr(func, "__globals__", {})
@@ -109,26 +228,24 @@ def _normalize_annotation_to_runtime_type(ann: Any) -> Any:
     if ann is None:
         return type(None)
 
-    origin = get_origin(ann)
+    origin, args = _origin_and_args(ann)
 
     # 1. Annotated[T, ...] -> T
     if origin is Annotated:
-        args = get_args(ann)
         return _normalize_annotation_to_runtime_type(args[0]) if args else Any
 
     # 2. Optional[T] (Union[T, None]) or general Union
     if origin in (Union, types.UnionType):
         # Filter out type(None) to unwrap Optional[T]
-        args = [a for a in get_args(ann) if a is not type(None)]
-        if not args:
+        non_none = [a for a in args if a is not type(None)]
+        if not non_none:
             return type(None)
         # Heuristic: Recursively normalize the first non-None argument as the base
-        return _normalize_annotation_to_runtime_type(args[0])
+        return _normalize_annotation_to_runtime_type(non_none[0])
 
     # 3. Literal["x", 1, True] -> type of first literal
     if origin is Literal:
-        lits = get_args(ann)
-        return type(lits[0]) if lits else Any
+        return type(args[0]) if args else Any
 
     # 4. Subscripted generics -> map to their origin
     if origin is not None:
@@ -142,6 +259,14 @@ def _normalize_annotation_to_runtime_type(ann: Any) -> Any:
     return ann
 
 
+# Scalar targets for which a value of exactly that type converts to itself.
+_PASSTHROUGH_SCALAR_TYPES = frozenset((str, int, float, bool))
+
+# Spellings accepted for `bool` parameters, compared after stripping and lowercasing.
+_TRUE_STRINGS = frozenset(("true", "1", "yes", "on"))
+_FALSE_STRINGS = frozenset(("false", "0", "no", "off"))
+
+
 def convert_cli_value_to_type(
     value: Any,
     to_type: Any,  # not just type: could be Annotated/Union/etc.
@@ -157,6 +282,9 @@ def convert_cli_value_to_type(
       - Enum (strings passed through, let Click handle Choice validation)
       - date/datetime, bool, scalars
     """
+    # Fast path: Click has usually produced the target scalar type already
+    if type(value) is to_type and to_type in _PASSTHROUGH_SCALAR_TYPES:
+        return value
 
     # Resolve postponed annotations if to_type is a string
     if isinstance(to_type, str) and func and param_name:
@@ -165,13 +293,14 @@ def convert_cli_value_to_type(
 
     # unwrap Annotated[T, ...]
     inspect_ann = to_type
-    if get_origin(inspect_ann) is Annotated:
-        inspect_ann = get_args(inspect_ann)[0]
+    origin, args = _origin_and_args(inspect_ann)
+    if origin is Annotated:
+        inspect_ann = args[0]
+        origin, args = _origin_and_args(inspect_ann)
 
     # --- Union / Optional
-    origin = get_origin(inspect_ann)
     if origin in (Union, UnionType):
-        inner_types = list(get_args(inspect_ann))
+        inner_types = list(args)
         non_none = [t for t in inner_types if t is not type(None)]
         none_in_union = len(non_none) != len(inner_types)
 
@@ -193,11 +322,9 @@ def convert_cli_value_to_type(
         return value
 
     # --- Containers ---
-    origin = get_origin(inspect_ann)
-
     # list[T]
     if origin is list:
-        (inner,) = get_args(inspect_ann) or (Any,)
+        (inner,) = args or (Any,)
         if isinstance(value, (list, tuple)):
             return [convert_cli_value_to_type(item, inner, func, param_name) for item in value]
         if isinstance(value, str):
@@ -208,7 +335,6 @@ def convert_cli_value_to_type(
 
     # tuple[T,...]
     if origin is tuple and isinstance(value, (list, tuple)):
-        args = get_args(inspect_ann)
         if len(args) == 2 and args[1] is Ellipsis:
             inner = args[0]
             return tuple(convert_cli_value_to_type(item, inner, func, param_name) for item in value)
@@ -218,7 +344,7 @@ def convert_cli_value_to_type(
 
     # set[T]
     if origin is set:
-        (inner,) = get_args(inspect_ann) or (Any,)
+        (inner,) = args or (Any,)
         if isinstance(value, (list, tuple)):
             return {convert_cli_value_to_type(item, inner, func, param_name) for item in value}
         if isinstance(value, str):
@@ -229,7 +355,6 @@ def convert_cli_value_to_type(
 
     # dict[K,V] from ["key=val", ...]
     if origin is dict and isinstance(value, (list, tuple)):
-        args = get_args(inspect_ann)
         key_t, val_t = (args[0], args[1]) if len(args) >= 2 else (str, Any)
         out: dict[Any, Any] = {}
         for item in value:
@@ -244,7 +369,7 @@ def convert_cli_value_to_type(
 
     # frozenset[T]
     if origin is frozenset:
-        (inner,) = get_args(inspect_ann) or (Any,)
+        (inner,) = args or (Any,)
         if isinstance(value, (list, tuple)):
             return frozenset(convert_cli_value_to_type(item, inner, func, param_name) for item in value)
         if isinstance(value, str):
@@ -268,9 +393,9 @@ def convert_cli_value_to_type(
         if isinstance(value, bool):
             return value
         v = str(value).strip().lower()
-        if v in ("true", "1", "yes", "on"):
+        if v in _TRUE_STRINGS:
             return True
-        if v in ("false", "0", "no", "off"):
+        if v in _FALSE_STRINGS:
             return False
 
     if isinstance(to_type, type):
@@ -314,9 +439,9 @@ def _extract_command_help_text(signature: inspect.Signature, func: Callable, att
         if isinstance(parameter.default, Param) and parameter.default.help:
             return parameter.default.help
 
-        annotation = parameter.annotation
-        if get_origin(annotation) is Annotated:
-            for metadata_item in get_args(annotation)[1:]:
+        origin, args = _origin_and_args(parameter.annotation)
+        if origin is Annotated:
+            for metadata_item in args[1:]:
                 if isinstance(metadata_item, Param) and metadata_item.help:
                     return metadata_item.help
     return ""
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, TypeVar
 
 _STATE_REGISTRY: list[type[State]] = []  # Registry of all `State` subclasses.
+_STATE_CLASSES: set[type] = set()  # `State` and all of its subclasses, for O(1) membership checks.
 
 
 class StateMeta(type):
@@ -30,6 +31,7 @@ class StateMeta(type):
             The newly created class.
         """
         cls = super().__new__(mcs, name, bases, namespace)
+        _STATE_CLASSES.add(cls)
 
         # Do not register the base `State` class itself, only its subclasses.
         if name != "State":
@@ -84,3 +86,23 @@ def get_state_classes() -> list[type[State]]:
         A `list` of `type` objects, where each type is a subclass of `State`.
     """
     return list(_STATE_REGISTRY)  # Return a copy to prevent external modification of the registry.
+
+
+def is_state_class(annotation: Any) -> bool:
+    """
+    Checks whether an annotation is `State` or one of its subclasses.
+
+    Every such class is created through `StateMeta`, so this is a set lookup
+    equivalent to `isinstance(annotation, type) and issubclass(annotation, State)`
+    without walking the MRO for the common non-State annotation.
+
+    Args:
+        annotation: Any parameter annotation.
+
+    Returns:
+        True if `annotation` is a `State` class, False otherwise.
+    """
+    try:
+        return annotation in _STATE_CLASSES
+    except TypeError:  # Unhashable annotations can never be State classes.
+        return False
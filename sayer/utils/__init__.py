@@ -1,4 +1,4 @@
 from .ui import echo, error, info, success, warning
 from .ui_helpers import confirm, progress, table
 
-__all__ = ["confirm", "progress", "table", "error", "info", "success", "warning", "echo"]
+__all__ = ("confirm", "progress", "table", "error", "info", "success", "warning", "echo")
@@ -2,6 +2,8 @@ import inspect
 
 import click
 
+from sayer.core.utils import _long_option_name
+
 SUPPORTS_HIDDEN = "hidden" in inspect.signature(click.Option).parameters
 
 
@@ -23,7 +25,7 @@ def coerce_argument_to_option(param_config: click.Argument, *, force: bool = Fal
     if not force:
         return param_config
 
-    flag_name = f"--{param_config.name.replace('_', '-')}"
+    flag_name = _long_option_name(param_config.name)
     option_kwargs = {
         "param_decls": [flag_name],
         "type": param_config.type,
@@ -1,8 +1,17 @@
 import os
+from collections import ChainMap
+from collections.abc import Mapping
 from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Optional
 
 
+@lru_cache(maxsize=256)
+def _environment_key(key: str) -> str:
+    """Returns the environment variable name for a configuration key."""
+    return key.upper()
+
+
 class SayerConfig:
     """
     Manages configuration settings, layering in-memory values over environment variables.
@@ -34,7 +43,9 @@ class SayerConfig:
         Returns:
             The configuration value found, or the default value if not found.
         """
-        return self._config.get(key, os.getenv(key.upper(), default))
+        if key in self._config:
+            return self._config[key]
+        return os.getenv(_environment_key(key), default)
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -49,17 +60,19 @@ class SayerConfig:
         """
         self._config[key] = value
 
-    def all(self) -> dict[str, Any]:
+    def all(self) -> Mapping[str, Any]:
         """
-        Returns a dictionary containing all effective configuration values.
+        Returns a read-only mapping of all effective configuration values.
 
         This includes all environment variables and the in-memory settings,
         with in-memory settings overriding environment variables for duplicate keys.
+        The mapping is a live view, so nothing is copied when it is built; use
+        `dict(config.all())` to take a snapshot.
 
         Returns:
-            A dictionary containing all configuration keys and their values.
+            A read-only mapping of all configuration keys and their values.
         """
-        return {**os.environ, **self._config}
+        return MappingProxyType(ChainMap(self._config, os.environ))
 
 
 @lru_cache(maxsize=1)
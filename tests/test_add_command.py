@@ -284,3 +284,16 @@ def test_nested_help_lists_all_subcommands():
     assert "x1" in result.output
     assert "g2" in result.output
     assert "sub3" in result.output
+
+
+def test_run_uses_current_group_name_as_prog_name(capsys):
+    root = Sayer(name="before", help="Root")
+
+    @root.command("hello")
+    def hello():
+        pass
+
+    root.cli.name = "after"
+    root.run(["--help"])
+
+    assert "Usage: after" in capsys.readouterr().out
@@ -178,3 +178,17 @@ def test_callback_invocation_emits_no_protected_args_deprecation():
 
     assert result.exit_code == 0
     assert not any("'protected_args' is deprecated" in str(item.message) for item in captured)
+
+
+def test_callback_positional_with_default_is_optional():
+    received = {}
+    app = Sayer(help="TestApp", add_version_option=False, invoke_without_command=True)
+
+    @app.callback()
+    def root(name: str = "guest"):
+        received["name"] = name
+
+    client = SayerTestClient(app)
+    result = client.invoke([])
+    assert result.exit_code == 0
+    assert received["name"] == "guest"
@@ -0,0 +1,25 @@
+from sayer.utils.config import SayerConfig
+
+
+def test_get_prefers_in_memory_values(monkeypatch):
+    monkeypatch.setenv("SAYER_TEST_MODE", "env")
+    config = SayerConfig()
+
+    assert config.get("sayer_test_mode") == "env"
+
+    config.set("sayer_test_mode", "memory")
+    assert config.get("sayer_test_mode") == "memory"
+    assert config.get("sayer_test_missing", "fallback") == "fallback"
+
+
+def test_all_layers_config_over_environment(monkeypatch):
+    monkeypatch.setenv("SAYER_TEST_LAYER", "env")
+    config = SayerConfig()
+    config.set("SAYER_TEST_LAYER", "memory")
+    config.set("only_in_memory", 1)
+
+    values = config.all()
+
+    assert values["SAYER_TEST_LAYER"] == "memory"
+    assert values["only_in_memory"] == 1
+    assert dict(values)["SAYER_TEST_LAYER"] == "memory"
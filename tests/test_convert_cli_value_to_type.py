@@ -104,6 +104,14 @@ def test_union_int_str_prefers_first_type():
     assert convert_cli_value_to_type("foo", T) == "foo"
 
 
+def test_equal_unions_keep_their_own_member_order():
+    # `Union[int, str] == Union[str, int]`; conversion must still follow the order written.
+    assert convert_cli_value_to_type("5", t.Union[int, str]) == 5
+    assert convert_cli_value_to_type("5", t.Union[str, int]) == "5"
+    assert convert_cli_value_to_type(["5"], list[t.Union[str, int]]) == ["5"]
+    assert convert_cli_value_to_type(["5"], list[t.Union[int, str]]) == [5]
+
+
 def test_annotated_dict_preserves_generics_for_conversion():
     Annotated = t.Annotated  # local alias to avoid lint issues
     ann = Annotated[dict[str, int], "meta"]
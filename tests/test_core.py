@@ -1,10 +1,10 @@
-from typing import Annotated
+from typing import Annotated, Union
 
 import click
 from click.testing import CliRunner
 
 from sayer.core.engine import command, get_commands, group
-from sayer.params import Param
+from sayer.params import Option, Param
 
 
 def test_command_registration():
@@ -155,3 +155,81 @@ def test_multiple_params_inference_with_param():
 
     assert result2.exit_code == 0
     assert result2.output.strip() == "AC"
+
+
+def test_shared_annotated_alias_converts_in_every_command():
+    Count = Annotated[int, Option(help="How many")]
+
+    @command
+    def first_count(count: Count):
+        click.echo(repr(count))
+
+    @command
+    def second_count(count: Count, label: Annotated[str, Option(help="Label")] = "items"):
+        click.echo(f"{count!r} {label}")
+
+    runner = CliRunner()
+    first = runner.invoke(first_count, ["--count", "3"])
+    second = runner.invoke(second_count, ["--count", "4", "--label", "apples"])
+
+    assert first.exit_code == 0
+    assert first.output.strip() == "3"
+    assert second.exit_code == 0
+    assert second.output.strip() == "4 apples"
+
+
+def test_option_and_command_names_are_kebab_cased():
+    @command
+    def clean_all(dry_run: bool = False):
+        click.echo(str(dry_run))
+
+    assert "clean-all" in get_commands()
+
+    result = CliRunner().invoke(clean_all, ["--dry-run"])
+
+    assert result.exit_code == 0
+    assert result.output.strip() == "True"
+
+
+def test_annotated_metadata_drives_conversion_and_help():
+    @command
+    def repeat(
+        count: Annotated[int, Option(help="How many times")],
+        word: Annotated[str, Option(), "Word to repeat"] = "hi",
+    ):
+        click.echo(" ".join([word] * count))
+
+    runner = CliRunner()
+    result = runner.invoke(repeat, ["--count", "2", "--word", "yo"])
+
+    assert result.exit_code == 0
+    assert result.output.strip() == "yo yo"
+
+    help_result = runner.invoke(repeat, ["--help"])
+
+    assert "How many times" in help_result.output
+    assert "Word to repeat" in help_result.output
+
+
+def test_union_member_order_is_kept_for_equal_annotations():
+    # `Union[int, str] == Union[str, int]`, but each command must convert in its own order.
+    @command
+    def int_first(value: Union[int, str]):
+        return value
+
+    @command
+    def str_first(value: Union[str, int]):
+        return value
+
+    @command
+    def optional_int_first(value: Union[int, str, None] = None):
+        return value
+
+    @command
+    def optional_str_first(value: Union[str, int, None] = None):
+        return value
+
+    assert int_first(value="5") == 5
+    assert str_first(value="5") == "5"
+    assert optional_int_first(value="5") == 5
+    assert optional_str_first(value="5") == "5"
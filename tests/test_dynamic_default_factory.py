@@ -1,6 +1,7 @@
 import time
 import uuid
 from datetime import datetime
+from typing import Annotated
 
 import click
 import pytest
@@ -183,3 +184,17 @@ def test_combo_override_partial(runner):
 
     assert res.exit_code == 0
     assert res.output.strip().startswith("7-")
+
+
+@command
+def annotated_factory(name: Annotated[str, Option(default_factory=lambda: "fact")] = None):
+    click.echo(repr(name))
+
+
+def test_annotated_default_factory_with_none_default(runner):
+    # Python 3.10 resolves this annotation to `Optional[Annotated[...]]`; the factory must still apply.
+    cmd = get_commands()["annotated-factory"]
+    res = runner.invoke(cmd, [])
+
+    assert res.exit_code == 0
+    assert res.output.strip() == "'fact'"
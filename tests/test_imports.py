@@ -0,0 +1,49 @@
+import subprocess
+import sys
+from pathlib import Path
+
+# Run from the checkout so `sayer` imports without being installed.
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _modules_after_import(statement: str) -> set[str]:
+    code = f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=REPO_ROOT, text=True)
+    return set(output.split())
+
+
+def test_import_sayer_is_lazy():
+    modules = _modules_after_import("import sayer")
+
+    assert "sayer" in modules
+    assert "sayer.app" not in modules
+    assert "sayer.core.engine" not in modules
+    assert "click" not in modules
+    assert "rich" not in modules
+
+
+def test_import_sayer_does_not_register_builtin_cli():
+    modules = _modules_after_import("import sayer\nsayer.Sayer")
+
+    assert "sayer.cli" not in modules
+    assert "sayer.core.client" not in modules
+
+
+def test_lazy_attribute_resolves_on_access():
+    modules = _modules_after_import("import sayer\nsayer.Sayer")
+
+    assert "sayer.app" in modules
+
+
+def test_reloading_engine_rebinds_click_group_command():
+    code = (
+        "import importlib\n"
+        "import click\n"
+        "import sayer.core.engine as engine\n"
+        "engine = importlib.reload(engine)\n"
+        "print(click.Group.command is engine.bind_command_to_group)\n"
+        "print(engine._ORIGINAL_CLICK_GROUP_COMMAND.__module__)\n"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=REPO_ROOT, text=True)
+
+    assert output.split() == ["True", "click.core"]